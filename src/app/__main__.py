@@ -0,0 +1,29 @@
+"""Entry point for `python -m app` with a fast path for trivial invocations."""
+
+import sys
+
+
+def _version() -> str:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("plugah-orchestrator")
+    except PackageNotFoundError:  # pragma: no cover - running from a checkout
+        return "0.0.0.dev0"
+
+
+def main() -> None:
+    # Handle a bare --version before Typer (and transitively rich/plugah)
+    # load, so the most common non-executing invocation exits in
+    # milliseconds. Only the sole-argument form is sniffed: anywhere else
+    # the token could be an option value and must reach Typer.
+    if len(sys.argv) == 2 and sys.argv[1] == "--version":
+        print(_version())
+        sys.exit(0)
+    from .cli import app
+
+    app()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,51 @@
 import asyncio
-import json
+import functools
 from pathlib import Path
 import typer
-from rich.console import Console
-from rich.table import Table
-
-from .config import default_settings, Settings
-from .io import write_json
-from .core import run_discovery, build_prd, plan_oag, execute_plan
 
+# Heavy modules (rich, .core -> plugah) are imported inside command bodies so
+# `--help` and argument-error paths never pay the full orchestration stack.
 app = typer.Typer(help="Plugah Orchestrator CLI")
-console = Console()
+
+@functools.cache
+def _console():
+    # Rich probes the terminal on construction; build one Console lazily so
+    # --help/--version never pay for it.
+    from rich.console import Console
+
+    return Console()
+
+def _version_callback(value: bool):
+    if value:
+        from .__main__ import _version
+        typer.echo(_version())
+        raise typer.Exit()
+
+@app.callback()
+def _main(
+    version: bool = typer.Option(
+        False, "--version", help="Show version and exit.", callback=_version_callback, is_eager=True
+    ),
+):
+    pass
+
+def _install_uvloop() -> None:
+    # Plugah stages are I/O-bound (LLM HTTP calls); uvloop speeds up the event
+    # loop when the optional 'perf' extra is installed.
+    try:
+        import uvloop
+    except ImportError:
+        return
+    uvloop.install()
 
 def _load_answers(path: Path) -> list[str]:
     if not path.exists():
         return []
-    data = json.loads(path.read_text())
+    from .io import _loads
+
+    # Parse UTF-8 bytes directly (orjson when available) instead of decoding
+    # to str first.
+    data = _loads(path.read_bytes())
     if isinstance(data, list):
         return [str(x) for x in data]
     raise typer.BadParameter("answers.json must contain a JSON array of strings")
@@ -31,7 +61,12 @@ def init(
     """
     Start discovery and write questions.json.
     """
-    cfg: Settings = default_settings()
+    from .config import default_settings
+    from .core import run_discovery, flush_writes
+
+    _install_uvloop()
+    console = _console()
+    cfg = default_settings()
     if problem:
         cfg.problem = problem
     if budget is not None:
@@ -41,7 +76,13 @@ def init(
         import os
         os.environ["PLUGAH_MODE"] = "mock"
     console.rule("[bold]Discovery: Startup Phase[/bold]")
-    questions = asyncio.run(run_discovery(cfg.problem, cfg.budget_hard_cap_usd, model_hint=model, policy=policy))
+
+    async def _init_flow():
+        questions = await run_discovery(cfg.problem, cfg.budget_hard_cap_usd, model_hint=model, policy=policy)
+        await flush_writes()
+        return questions
+
+    questions = asyncio.run(_init_flow())
     console.print(f"[green]Wrote[/green] questions.json with {len(questions)} questions.")
 
 @app.command()
@@ -56,7 +97,12 @@ def plan(
     """
     Build PRD from answers, then plan OAG. Writes prd.json and oag.json.
     """
-    cfg: Settings = default_settings()
+    from .config import default_settings
+    from .core import build_prd, plan_oag, flush_writes
+
+    _install_uvloop()
+    console = _console()
+    cfg = default_settings()
     if problem:
         cfg.problem = problem
     if budget is not None:
@@ -69,19 +115,29 @@ def plan(
     if not answers:
         console.print("[yellow]No answers found; provide answers.json with an array of strings.[/yellow]")
 
-    console.rule("[bold]PRD Generation[/bold]")
-    prd = asyncio.run(build_prd(answers, cfg.problem, cfg.budget_hard_cap_usd, model_hint=model, policy=policy))
-    console.print("[green]Wrote[/green] prd.json")
+    # Run both stages under one event loop so Plugah can reuse sessions/pools.
+    async def _plan_flow():
+        console.rule("[bold]PRD Generation[/bold]")
+        prd = await build_prd(answers, cfg.problem, cfg.budget_hard_cap_usd, model_hint=model, policy=policy)
+        console.print("[green]Wrote[/green] prd.json")
+
+        console.rule("[bold]Organization Planning (OAG)[/bold]")
+        await plan_oag(prd, cfg.budget_hard_cap_usd, model_hint=model, policy=policy)
+        await flush_writes()
+        console.print("[green]Wrote[/green] oag.json (Organizational Agent Graph)")
 
-    console.rule("[bold]Organization Planning (OAG)[/bold]")
-    _ = asyncio.run(plan_oag(prd, cfg.budget_hard_cap_usd, model_hint=model, policy=policy))
-    console.print("[green]Wrote[/green] oag.json (Organizational Agent Graph)")
+    asyncio.run(_plan_flow())
 
 @app.command()
 def run(mock: bool = typer.Option(False, help="Run Plugah in mock offline mode")):
     """
     Execute the planned work and print a cost summary. Writes results.json.
     """
+    from rich.table import Table
+    from .core import execute_plan
+
+    _install_uvloop()
+    console = _console()
     if mock:
         import os
         os.environ["PLUGAH_MODE"] = "mock"
@@ -108,25 +164,35 @@ def quickstart(
     """
     One-shot demo: discovery → PRD → OAG → execution (non-interactive).
     """
+    from .core import run_discovery, build_prd, plan_oag, execute_plan
+    from .io import write_json
+
+    _install_uvloop()
+    console = _console()
     if mock:
         import os
         os.environ["PLUGAH_MODE"] = "mock"
     console.rule("[bold]Quickstart[/bold]")
 
-    # Discovery
-    questions = asyncio.run(run_discovery(problem, budget, model_hint=model, policy=policy))
-    if auto_answers:
-        answers = [f"Auto-answer {i+1}: {q[:60]}" for i, q in enumerate(questions)]
-        write_json("answers.json", answers)
-    else:
-        answers = _load_answers(Path("answers.json"))
-
-    # PRD
-    prd = asyncio.run(build_prd(answers, problem, budget, model_hint=model, policy=policy))
-    # OAG
-    _ = asyncio.run(plan_oag(prd, budget, model_hint=model, policy=policy))
-    # Execute
-    results = asyncio.run(execute_plan())
+    # One event loop for all four stages: avoids three loop setup/teardown
+    # cycles and lets Plugah keep HTTP sessions alive across stages.
+    async def _quickstart_flow():
+        # Discovery
+        questions = await run_discovery(problem, budget, model_hint=model, policy=policy)
+        if auto_answers:
+            answers = [f"Auto-answer {i+1}: {q[:60]}" for i, q in enumerate(questions)]
+            write_json("answers.json", answers)
+        else:
+            answers = _load_answers(Path("answers.json"))
+
+        # PRD
+        prd = await build_prd(answers, problem, budget, model_hint=model, policy=policy)
+        # OAG
+        await plan_oag(prd, budget, model_hint=model, policy=policy)
+        # Execute
+        return await execute_plan()
+
+    results = asyncio.run(_quickstart_flow())
 
     total_cost = results.get("total_cost", 0.0)
     console.print(f"[bold green]Project complete![/bold green] Total cost: ${total_cost:,.2f}")
@@ -1,3 +1,5 @@
+import functools
+
 from pydantic import BaseModel
 from typing import Literal
 
@@ -11,5 +13,11 @@ class Settings(BaseModel):
     budget_policy: Literal["CONSERVATIVE", "BALANCED", "AGGRESSIVE"] = "BALANCED"
     model_hint: str | None = None
 
-def default_settings() -> "Settings":
+@functools.cache
+def _default() -> Settings:
     return Settings()
+
+def default_settings() -> "Settings":
+    # Validate the static defaults once, then hand out cheap copies the CLI
+    # can mutate freely.
+    return _default().model_copy()
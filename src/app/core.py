@@ -1,4 +1,8 @@
+import asyncio
+import hashlib
 import inspect
+import json
+import os
 from typing import Any, Sequence
 
 # Prefer stable module paths with fallbacks and install Seren planner
@@ -15,8 +19,10 @@ except Exception:  # pragma: no cover
     except Exception:
         BudgetPolicy = None  # type: ignore
 
-from .io import write_json
-from .seren_planner import install_seren_planner
+from contextlib import contextmanager
+
+from .io import read_json, write_json
+from .seren_planner import PLUGAH_MODE_VAR, install_seren_planner
 
 # Keep a single BoardRoom per-process to preserve internal state across stages.
 _boardroom: BoardRoom | None = None
@@ -52,102 +58,211 @@ def _br() -> BoardRoom:
             pass
     return _boardroom
 
-def map_policy(name: str | None):
-    if not name or BudgetPolicy is None:
-        return name or "BALANCED"
-    name = name.upper()
-    return {
+_POLICY_MAP = (
+    {
         "CONSERVATIVE": BudgetPolicy.CONSERVATIVE,
         "BALANCED": BudgetPolicy.BALANCED,
         "AGGRESSIVE": BudgetPolicy.AGGRESSIVE,
-    }.get(name, BudgetPolicy.BALANCED)
+    }
+    if BudgetPolicy is not None
+    else {}
+)
+
+def map_policy(name: str | None):
+    if not name or BudgetPolicy is None:
+        return name or "BALANCED"
+    if isinstance(name, BudgetPolicy):
+        return name
+    return _POLICY_MAP.get(name.upper(), BudgetPolicy.BALANCED)
+
+# inspect.signature is expensive and the same BoardRoom methods are called on
+# every stage, so cache accepted parameter names (and whether the function is
+# a coroutine function) per underlying function.
+_SIG_CACHE: dict[Any, tuple[frozenset[str], bool]] = {}
+
+def _fn_info(fn) -> tuple[frozenset[str], bool]:
+    key = getattr(fn, "__func__", fn)
+    info = _SIG_CACHE.get(key)
+    if info is None:
+        info = (frozenset(inspect.signature(fn).parameters), inspect.iscoroutinefunction(key))
+        _SIG_CACHE[key] = info
+    return info
 
 def _filter_kwargs(fn, kwargs: dict[str, Any]) -> dict[str, Any]:
     try:
-        sig = inspect.signature(fn)
-        keys = sig.parameters.keys()
+        keys = _fn_info(fn)[0]
         return {k: v for k, v in kwargs.items() if k in keys and v is not None}
     except Exception:
         return {}
 
+# Stage outputs are written on worker threads so serialization/disk I/O
+# overlaps the next Plugah call instead of blocking the event loop.
+_pending_writes: set[asyncio.Task] = set()
+
+def _schedule_write(path: str, obj: Any) -> None:
+    task = asyncio.create_task(asyncio.to_thread(write_json, path, obj))
+    _pending_writes.add(task)
+    task.add_done_callback(_pending_writes.discard)
+
+async def flush_writes() -> None:
+    """Wait for all scheduled JSON writes to hit disk."""
+    if _pending_writes:
+        await asyncio.gather(*tuple(_pending_writes))
+
+# Optional content-addressed cache for the LLM-backed stages. Enabled with
+# SEREN_CACHE=1; entries live under .seren_cache/ keyed on a SHA-256 of the
+# stage inputs, so repeated dev-loop runs skip Plugah entirely. Intended for
+# iterating on discovery/PRD/OAG outputs — execution still needs a BoardRoom
+# that ran the stages live, so leave it unset for full end-to-end runs.
+def _cache_enabled() -> bool:
+    return bool(os.getenv("SEREN_CACHE"))
+
+def _cache_key(*parts: Any) -> str:
+    payload = json.dumps(parts, sort_keys=True, default=str).encode()
+    return hashlib.sha256(payload).hexdigest()
+
+def _cache_get(stage: str, key: str) -> Any | None:
+    if not _cache_enabled():
+        return None
+    return read_json(f".seren_cache/{stage}-{key}.json")
+
+def _cache_put(stage: str, key: str, obj: Any) -> None:
+    if _cache_enabled():
+        _schedule_write(f".seren_cache/{stage}-{key}.json", obj)
+
+@contextmanager
+def _mode_scope(mode: str | None):
+    """Scope a PLUGAH_MODE override ("mock" or "live") to one stage call.
+
+    SerenPlanner reads the ContextVar, so concurrent web requests stay
+    isolated from each other. Plugah's own stages still read the env var
+    directly, so the env is set for the duration of the call and restored
+    afterwards — mixed mock/live traffic in one process therefore remains
+    best-effort until plugah accepts a mode argument.
+    """
+    if mode is None:
+        yield
+        return
+    token = PLUGAH_MODE_VAR.set(mode)
+    prev = os.environ.get("PLUGAH_MODE")
+    if prev != mode:
+        os.environ["PLUGAH_MODE"] = mode
+    try:
+        yield
+    finally:
+        PLUGAH_MODE_VAR.reset(token)
+        if prev != mode:
+            if prev is None:
+                os.environ.pop("PLUGAH_MODE", None)
+            else:
+                os.environ["PLUGAH_MODE"] = prev
+
 async def _call_maybe_async(fn, /, *args, **kwargs):
+    try:
+        is_coro = _fn_info(fn)[1]
+    except Exception:
+        is_coro = False
+    if is_coro:
+        # Known coroutine function: skip the per-call isawaitable check.
+        return await fn(*args, **kwargs)
     res = fn(*args, **kwargs)
     if inspect.isawaitable(res):
         return await res
     return res
 
-async def run_discovery(problem: str, budget_usd: float, *, model_hint: str | None = None, policy: str | None = None) -> list[str]:
+async def run_discovery(problem: str, budget_usd: float, *, model_hint: str | None = None, policy: str | None = None, mode: str | None = None) -> list[str]:
     """
     Returns discovery questions from Plugah's startup_phase.
     Also writes questions.json for convenience.
     """
-    fn = _br().startup_phase
-    kwargs = _filter_kwargs(fn, {
-        "problem": problem,
-        "budget_usd": budget_usd,
-        "model_hint": model_hint,
-        "policy": map_policy(policy),
-        "context": None,
-    })
-    result = await _call_maybe_async(fn, **kwargs)
-    # Ensure Plugah's audit log folder exists if run_dir is present
-    try:
-        br = _br()
-        run_dir = getattr(br, "run_dir", None)
-        if run_dir:
-            from pathlib import Path
-            Path(run_dir, "logs").mkdir(parents=True, exist_ok=True)
-    except Exception:
-        pass
-    # Accept dict with "questions" or direct list
-    if isinstance(result, dict):
-        qs = result.get("questions", [])
-    else:
-        qs = result
-    write_json("questions.json", qs)
-    return list(qs)
-
-async def build_prd(answers: Sequence[str], problem: str, budget_usd: float, *, model_hint: str | None = None, policy: str | None = None) -> dict[str, Any]:
+    with _mode_scope(mode):
+        cache_key = _cache_key("discovery", problem, budget_usd, model_hint, policy, mode)
+        cached = _cache_get("discovery", cache_key)
+        if cached is not None:
+            _schedule_write("questions.json", cached)
+            return list(cached)
+        fn = _br().startup_phase
+        kwargs = _filter_kwargs(fn, {
+            "problem": problem,
+            "budget_usd": budget_usd,
+            "model_hint": model_hint,
+            "policy": map_policy(policy),
+            "context": None,
+        })
+        result = await _call_maybe_async(fn, **kwargs)
+        # Ensure Plugah's audit log folder exists if run_dir is present
+        try:
+            br = _br()
+            run_dir = getattr(br, "run_dir", None)
+            if run_dir:
+                from pathlib import Path
+                Path(run_dir, "logs").mkdir(parents=True, exist_ok=True)
+        except Exception:
+            pass
+        # Accept dict with "questions" or direct list
+        if isinstance(result, dict):
+            qs = result.get("questions", [])
+        else:
+            qs = result
+        _schedule_write("questions.json", qs)
+        _cache_put("discovery", cache_key, qs)
+        return list(qs)
+
+async def build_prd(answers: Sequence[str], problem: str, budget_usd: float, *, model_hint: str | None = None, policy: str | None = None, mode: str | None = None) -> dict[str, Any]:
     """
     Feeds discovery answers to produce a PRD.
     Writes prd.json.
     """
-    fn = _br().process_discovery
-    kwargs = _filter_kwargs(fn, {
-        "answers": list(answers),
-        "problem": problem,
-        "budget_usd": budget_usd,
-        "model_hint": model_hint,
-        "policy": map_policy(policy),
-    })
-    prd = await _call_maybe_async(fn, **kwargs)
-    write_json("prd.json", prd)
-    return prd
-
-async def plan_oag(prd: dict[str, Any], budget_usd: float, *, model_hint: str | None = None, policy: str | None = None) -> dict[str, Any]:
+    with _mode_scope(mode):
+        cache_key = _cache_key("prd", problem, budget_usd, model_hint, policy, list(answers), mode)
+        cached = _cache_get("prd", cache_key)
+        if cached is not None:
+            _schedule_write("prd.json", cached)
+            return cached
+        fn = _br().process_discovery
+        kwargs = _filter_kwargs(fn, {
+            "answers": list(answers),
+            "problem": problem,
+            "budget_usd": budget_usd,
+            "model_hint": model_hint,
+            "policy": map_policy(policy),
+        })
+        prd = await _call_maybe_async(fn, **kwargs)
+        _schedule_write("prd.json", prd)
+        _cache_put("prd", cache_key, prd)
+        return prd
+
+async def plan_oag(prd: dict[str, Any], budget_usd: float, *, model_hint: str | None = None, policy: str | None = None, mode: str | None = None) -> dict[str, Any]:
     """
     Plans the Organizational Agent Graph (OAG) from the PRD.
     Writes oag.json.
     """
-    fn = _br().plan_organization
-    kwargs = _filter_kwargs(fn, {
-        "prd": prd,
-        "budget_usd": budget_usd,
-        "model_hint": model_hint,
-        "policy": map_policy(policy),
-    })
-    oag = await _call_maybe_async(fn, **kwargs)
-    oag_dict = oag
-    # If OAG is a Pydantic model, dump it to dict for JSON
-    if hasattr(oag, "model_dump"):
-        try:
-            oag_dict = oag.model_dump(mode="json")
-        except TypeError:
-            oag_dict = oag.model_dump()
-    elif hasattr(oag, "dict"):
-        oag_dict = oag.dict()
-    write_json("oag.json", oag_dict)
-    return oag_dict  # keep returning dict for callers
+    with _mode_scope(mode):
+        cache_key = _cache_key("oag", prd, budget_usd, model_hint, policy, mode)
+        cached = _cache_get("oag", cache_key)
+        if cached is not None:
+            _schedule_write("oag.json", cached)
+            return cached
+        fn = _br().plan_organization
+        kwargs = _filter_kwargs(fn, {
+            "prd": prd,
+            "budget_usd": budget_usd,
+            "model_hint": model_hint,
+            "policy": map_policy(policy),
+        })
+        oag = await _call_maybe_async(fn, **kwargs)
+        oag_dict = oag
+        # If OAG is a Pydantic model, dump it to dict for JSON
+        if hasattr(oag, "model_dump"):
+            try:
+                oag_dict = oag.model_dump(mode="json")
+            except TypeError:
+                oag_dict = oag.model_dump()
+        elif hasattr(oag, "dict"):
+            oag_dict = oag.dict()
+        _schedule_write("oag.json", oag_dict)
+        _cache_put("oag", cache_key, oag_dict)
+        return oag_dict  # keep returning dict for callers
 
 async def execute_plan(on_event: Any | None = None) -> dict[str, Any]:
     """
@@ -166,5 +281,6 @@ async def execute_plan(on_event: Any | None = None) -> dict[str, Any]:
     elif not isinstance(results, dict) and hasattr(results, "__dict__"):
         # Best-effort conversion
         results_dict = dict(results.__dict__)
-    write_json("results.json", results_dict)
+    _schedule_write("results.json", results_dict)
+    await flush_writes()
     return results_dict
@@ -2,15 +2,34 @@ import json
 from pathlib import Path
 from typing import Any
 
+try:
+    # orjson parses/serializes UTF-8 bytes directly and is several times
+    # faster than stdlib json on the nested PRD/OAG payloads we write.
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 def _root() -> Path:
     # Resolve to current working directory at call time
     return Path.cwd()
 
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _dumps(obj: Any, default: Any = None) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(
+            obj, default=default, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=default).encode()
+
 def read_json(path: str) -> Any | None:
     p = _root() / path
     if not p.exists():
         return None
-    return json.loads(p.read_text())
+    return _loads(p.read_bytes())
 
 def _json_default(o: Any):
     # Try common object-to-dict conversions
@@ -30,7 +49,21 @@ def _json_default(o: Any):
         return list(o)
     return str(o)
 
+# Directories we have already created this process; skips a stat+mkdir
+# syscall per write since all stage outputs land in the same place.
+_MKDIR_CACHE: set[Path] = set()
+
 def write_json(path: str, obj: Any) -> None:
     p = _root() / path
-    p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(json.dumps(obj, indent=2, ensure_ascii=False, default=_json_default))
+    parent = p.parent
+    if parent not in _MKDIR_CACHE:
+        parent.mkdir(parents=True, exist_ok=True)
+        _MKDIR_CACHE.add(parent)
+    # Stage outputs are usually plain dict/list JSON already (e.g. an OAG that
+    # went through model_dump), so try the plain serializer first and only pay
+    # for the object-conversion hook when something exotic is embedded.
+    try:
+        data = _dumps(obj)
+    except TypeError:
+        data = _dumps(obj, default=_json_default)
+    p.write_bytes(data)
@@ -1,8 +1,10 @@
 """
 Seren Planner: OpenAI-driven planner that Plugah can use for OAG creation.
 
-By default we install this planner into `plugah.boardroom.Planner` so that
-BoardRoom.plan_organization() uses Seren rather than the stock planner.
+Call `install_seren_planner()` to swap this planner into
+`plugah.boardroom.Planner` so BoardRoom.plan_organization() uses Seren rather
+than the stock planner; app.core does this lazily before its first BoardRoom
+call, so importing this module stays side-effect free.
 
 Behavior:
 - In mock/offline mode (PLUGAH_MODE=mock), generate a deterministic OAG via
@@ -14,8 +16,20 @@ Behavior:
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
+import math
 import os
+import pickle
+import random
+import threading
+import time
 import uuid
+from collections import OrderedDict, defaultdict
+from contextvars import ContextVar
+from itertools import pairwise
+from functools import lru_cache
 from typing import Any
 
 from plugah.oag_schema import (
@@ -39,11 +53,513 @@ from plugah.oag_schema import (
 )
 from plugah.selector import Selector
 
+try:
+    # Same optional speedup app.io uses: orjson parses the multi-KB design
+    # responses several times faster than stdlib json.
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 try:
     # Prefer new OpenAI SDK. Import lazily in methods to avoid hard dependency in mock mode.
     from openai import OpenAI  # type: ignore
+    from openai import AsyncOpenAI  # type: ignore
 except Exception:  # pragma: no cover
     OpenAI = None  # type: ignore
+    AsyncOpenAI = None  # type: ignore
+
+
+# Environment flags that are effectively constant once planning starts
+# (provider keys, model hints) are resolved lazily once instead of going
+# through the os.environ proxy on every plan() call. PLUGAH_MODE must NOT go
+# through this cache — the web layer flips it per request. _reset_env_cache()
+# exists for embedders that change the cached flags at runtime.
+_ENV_CACHE: dict[str, str | None] = {}
+
+
+def _env(name: str) -> str | None:
+    if name not in _ENV_CACHE:
+        _ENV_CACHE[name] = os.getenv(name)
+    return _ENV_CACHE[name]
+
+
+def _reset_env_cache() -> None:
+    _ENV_CACHE.clear()
+
+
+# Request-scoped mode override. Web handlers set this (via app.core's mode=
+# parameter) for every request — "mock" or the explicit "live" sentinel — so
+# the ContextVar, not ambient process state, decides and concurrent requests
+# cannot leak mock mode into each other. The PLUGAH_MODE env var remains the
+# fallback for the CLI and plain scripts, read live rather than through
+# _ENV_CACHE: a first-read cache would pin every later request to whatever
+# mode the process's first plan ran under.
+PLUGAH_MODE_VAR: ContextVar[str | None] = ContextVar("plugah_mode", default=None)
+
+
+def _mode() -> str | None:
+    return PLUGAH_MODE_VAR.get() or os.getenv("PLUGAH_MODE")
+
+
+def _json_loads(data: str | bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+# Ordered role-classification rules scanned first-match-wins: prefix rules
+# cover leading titles ("CEO", "VP Engineering"), substring rules catch
+# embedded forms ("Senior Director of X"). Anything unmatched is an IC.
+_LEVEL_RULES: tuple[tuple[str, Any, RoleLevel], ...] = (
+    ("prefix", ("ceo", "cto", "cfo"), RoleLevel.C_SUITE),
+    ("contains", "chief", RoleLevel.C_SUITE),
+    ("prefix", ("vp",), RoleLevel.VP),
+    ("contains", "director", RoleLevel.DIRECTOR),
+    ("contains", "manager", RoleLevel.MANAGER),
+)
+
+
+@lru_cache(maxsize=512)
+def _role_to_level(role: str) -> RoleLevel:
+    # Fallback only; the primary path takes the level from the model output.
+    # Cached because role strings repeat heavily across plans (CEO, VP
+    # Engineering, "IC 1..N" templates).
+    r = role.lower()
+    for kind, needle, level in _LEVEL_RULES:
+        if r.startswith(needle) if kind == "prefix" else needle in r:
+            return level
+    return RoleLevel.IC
+
+
+def _add_nodes(oag: OAG, nodes: list) -> None:
+    """Insert nodes as one batch, preferring a native bulk API when present."""
+    bulk = getattr(oag, "add_nodes", None)
+    if bulk is not None:
+        bulk(nodes)
+    elif isinstance(oag.nodes, dict):
+        oag.nodes.update((n.id, n) for n in nodes)
+    else:  # pragma: no cover - unexpected OAG shape
+        for n in nodes:
+            oag.add_node(n)
+
+
+def _add_edges(oag: OAG, edges: list[Edge]) -> None:
+    """Insert edges as one batch, preferring a native bulk API when present."""
+    bulk = getattr(oag, "add_edges", None)
+    if bulk is not None:
+        bulk(edges)
+    elif isinstance(oag.edges, list):
+        oag.edges.extend(edges)
+    else:  # pragma: no cover - unexpected OAG shape
+        for e in edges:
+            oag.add_edge(e)
+
+
+# Formatted staffing role names are memoized across plans so the builders do
+# not re-run the format machinery per index; lists grow on demand.
+_ROLE_TEMPLATES = {"director": "Director {}", "manager": "Engineering Manager {}", "ic": "IC {}"}
+_ROLE_NAMES: dict[str, list[str]] = {kind: [] for kind in _ROLE_TEMPLATES}
+
+
+def _role_names(kind: str, count: int) -> list[str]:
+    names = _ROLE_NAMES[kind]
+    if count > len(names):
+        template = _ROLE_TEMPLATES[kind]
+        names.extend(template.format(i) for i in range(len(names) + 1, count + 1))
+    return names[:count]
+
+
+# Shared Selector for planners constructed without one; BoardRoom may build a
+# fresh planner per request and Selector init is not free.
+_DEFAULT_SELECTOR: Selector | None = None
+
+
+def _default_selector() -> Selector:
+    global _DEFAULT_SELECTOR
+    if _DEFAULT_SELECTOR is None:
+        _DEFAULT_SELECTOR = Selector()
+    return _DEFAULT_SELECTOR
+
+
+def _construct(model_cls, **fields):
+    """Build a pydantic model without validation.
+
+    Used only on the deterministic heuristic path, where every field is
+    produced locally and known-good; skipping validation makes bulk
+    AgentSpec/TaskSpec/Edge construction several times cheaper. The untrusted
+    model-output parse path keeps validated construction.
+    """
+    ctor = getattr(model_cls, "model_construct", None) or getattr(model_cls, "construct", None)
+    if ctor is None:  # pragma: no cover - plain class
+        return model_cls(**fields)
+    return ctor(**fields)
+
+
+def _mint_ids(n: int) -> list[str]:
+    """Batch-generate opaque hex node ids from a single urandom read.
+
+    uuid.uuid4() costs one os.urandom(16) syscall plus formatting per id;
+    minting a whole org's worth of ids at once amortizes that to one read.
+    """
+    buf = os.urandom(16 * n)
+    return [buf[i:i + 16].hex() for i in range(0, 16 * n, 16)]
+
+
+# Exact-match cache of model-produced designs, keyed on (PRD, budget, model).
+# PRDs repeat heavily in CI, demos, and retries, and a hit skips the OpenAI
+# round-trip entirely. The in-process tier is always on but bounded LRU-style
+# (designs are multi-KB and a long-running web process would otherwise grow
+# without limit); entries also persist under .seren_cache/ when SEREN_CACHE
+# is set (the same switch app.core uses for its stage cache).
+_DESIGN_CACHE: OrderedDict[str, dict[str, Any]] = OrderedDict()
+_DESIGN_CACHE_MAX = 128
+
+
+def _design_cache_store(key: str, design: dict[str, Any]) -> None:
+    _DESIGN_CACHE[key] = design
+    _DESIGN_CACHE.move_to_end(key)
+    if len(_DESIGN_CACHE) > _DESIGN_CACHE_MAX:
+        _DESIGN_CACHE.popitem(last=False)
+
+
+def _design_cache_key(prd: dict[str, Any], budget_usd: float, model: str) -> str:
+    payload = json.dumps(
+        {"prd": prd, "budget": budget_usd, "model": model}, sort_keys=True, default=str
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _design_cache_get(key: str) -> dict[str, Any] | None:
+    design = _DESIGN_CACHE.get(key)
+    if design is not None:
+        _DESIGN_CACHE.move_to_end(key)
+        return design
+    if os.getenv("SEREN_CACHE"):
+        from .io import read_json
+
+        disk = read_json(f".seren_cache/design-{key}.json")
+        if isinstance(disk, dict):
+            _design_cache_store(key, disk)
+            return disk
+    return None
+
+
+def _design_cache_put(key: str, design: dict[str, Any]) -> None:
+    _design_cache_store(key, design)
+    if os.getenv("SEREN_CACHE"):
+        from .io import write_json
+
+        write_json(f".seren_cache/design-{key}.json", design)
+
+
+# Coarse plan-template cache. PRDs sharing a domain, scope bucket, budget
+# bracket, and objective count tend to produce structurally similar designs,
+# so with SEREN_TEMPLATE_CACHE set a signature hit reuses the last design
+# seen for that shape instead of regenerating it. Off by default: the reused
+# design carries task titles from the earlier PRD, which suits demo/CI-style
+# traffic but not bespoke plans.
+_TEMPLATE_CACHE: dict[tuple, dict[str, Any]] = {}
+
+
+def _template_cache_enabled() -> bool:
+    return bool(os.getenv("SEREN_TEMPLATE_CACHE"))
+
+
+# Retry/throttle policy for live OpenAI calls. Transient failures (429s,
+# 5xx, dropped connections) back off and retry before plan()'s heuristic
+# fallback gets a say, so rate-limit bursts no longer silently degrade plan
+# quality. SEREN_RETRIES bounds the attempts; SEREN_RPM (requests/minute,
+# unset disables it) spaces request starts process-wide.
+_RATE_LOCK = threading.Lock()
+_next_request_at = 0.0
+
+
+def _request_delay() -> float:
+    """Reserve the next request slot; returns seconds to wait before it."""
+    global _next_request_at
+    rpm = float(_env("SEREN_RPM") or 0)
+    if rpm <= 0:
+        return 0.0
+    interval = 60.0 / rpm
+    with _RATE_LOCK:
+        now = time.monotonic()
+        start = max(now, _next_request_at)
+        _next_request_at = start + interval
+        return start - now
+
+
+def _should_retry(exc: BaseException) -> bool:
+    try:
+        from openai import APIConnectionError, APIStatusError, RateLimitError
+    except ImportError:  # pragma: no cover
+        return False
+    if isinstance(exc, (RateLimitError, APIConnectionError)):
+        return True
+    # Other APIStatusErrors: retry server-side failures, not 4xx (auth,
+    # bad request) which will not get better on their own.
+    return isinstance(exc, APIStatusError) and exc.status_code >= 500
+
+
+def _backoff(attempt: int) -> float:
+    return min(30.0, 0.5 * 2 ** attempt + random.random())
+
+
+def _with_retries(call):
+    # Clamped so a zero/negative SEREN_RETRIES still makes the one real call.
+    attempts = max(1, int(_env("SEREN_RETRIES") or 5))
+    for attempt in range(attempts):
+        delay = _request_delay()
+        if delay > 0:
+            time.sleep(delay)
+        try:
+            return call()
+        except Exception as e:
+            if attempt + 1 >= attempts or not _should_retry(e):
+                raise
+            time.sleep(_backoff(attempt))
+
+
+async def _with_retries_async(call):
+    attempts = max(1, int(_env("SEREN_RETRIES") or 5))
+    for attempt in range(attempts):
+        delay = _request_delay()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        try:
+            return await call()
+        except Exception as e:
+            if attempt + 1 >= attempts or not _should_retry(e):
+                raise
+            await asyncio.sleep(_backoff(attempt))
+
+
+@lru_cache(maxsize=1)
+def _get_client() -> Any:
+    """Shared OpenAI client backed by a pooled httpx transport.
+
+    Constructing OpenAI() per plan builds a fresh httpx.Client and loses the
+    keep-alive connections between calls; one cached client reuses TLS
+    sessions across plans and bounds the pool size.
+    """
+    import httpx
+
+    return OpenAI(
+        http_client=httpx.Client(
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        )
+    )
+
+
+# AsyncOpenAI clients keyed by event loop. Pooled connections belong to the
+# loop they were opened on, and plan_many() runs a fresh loop per call via
+# asyncio.run — a single cached client would resurface sockets bound to a
+# closed loop and every call would silently fall back to the heuristic.
+# Entries for closed loops are pruned when a new loop shows up.
+_ASYNC_CLIENTS: dict[Any, Any] = {}
+
+
+def _get_async_client() -> Any:
+    """Shared AsyncOpenAI client for the current event loop.
+
+    Prefers the SDK's aiohttp transport when the aiohttp extra is installed
+    (it multiplexes better under concurrency), otherwise falls back to a
+    pooled httpx.AsyncClient with the same limits as the sync client.
+    """
+    loop = asyncio.get_running_loop()
+    client = _ASYNC_CLIENTS.get(loop)
+    if client is None:
+        for stale in [l for l in _ASYNC_CLIENTS if l.is_closed()]:
+            del _ASYNC_CLIENTS[stale]
+        try:
+            from openai import DefaultAioHttpClient  # type: ignore
+
+            client = AsyncOpenAI(http_client=DefaultAioHttpClient())
+        except ImportError:
+            import httpx
+
+            client = AsyncOpenAI(
+                http_client=httpx.AsyncClient(
+                    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                )
+            )
+        _ASYNC_CLIENTS[loop] = client
+    return client
+
+
+class _AgentStage:
+    """Slotted staging row for an agent before pydantic construction.
+
+    The staffing builders accumulate these cheap rows and materialize the
+    AgentSpecs/Edges in one batch, keeping peak allocation low during large
+    plans.
+    """
+
+    __slots__ = ("role", "level", "mgr_id", "edge_from")
+
+    def __init__(self, role: str, level: RoleLevel, mgr_id: str | None, edge_from: str | None):
+        self.role = role
+        self.level = level
+        self.mgr_id = mgr_id
+        self.edge_from = edge_from
+
+
+def _stage_level(oag: OAG, roles: list[str], level: RoleLevel, parents: list[AgentSpec]) -> list[AgentSpec]:
+    """Stage and materialize one org level under the given parents.
+
+    The parent-id rotation is precomputed into one array so the per-agent
+    loop carries no modulo arithmetic or attribute lookups; manager_id always
+    points at the first parent, matching the original builders.
+    """
+    count = len(roles)
+    mgr_id = parents[0].id if parents else None
+    if parents:
+        parent_ids = [p.id for p in parents]
+        n = len(parent_ids)
+        edge_from = [parent_ids[i % n] for i in range(count)]
+    else:
+        edge_from = [None] * count
+    rows = [_AgentStage(role, level, mgr_id, src) for role, src in zip(roles, edge_from)]
+    return _materialize_stages(oag, rows)
+
+
+def _materialize_stages(oag: OAG, rows: list[_AgentStage]) -> list[AgentSpec]:
+    ids = _mint_ids(2 * len(rows))
+    specs: list[AgentSpec] = []
+    edges: list[Edge] = []
+    for i, row in enumerate(rows):
+        spec = _construct(AgentSpec, id=ids[2 * i], role=row.role, level=row.level, manager_id=row.mgr_id)
+        if row.edge_from is not None:
+            edges.append(_construct(Edge, id=ids[2 * i + 1], from_id=row.edge_from, to_id=spec.id))
+        specs.append(spec)
+    _add_nodes(oag, specs)
+    _add_edges(oag, edges)
+    return specs
+
+
+# Response schema captures decisions to avoid local heuristics.
+_OAG_SCHEMA = {
+    "name": "oag_design",
+    "schema": {
+        "type": "object",
+        "additionalProperties": False,
+        "properties": {
+            "agents": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "additionalProperties": False,
+                    "properties": {
+                        "role": {"type": "string"},
+                        "level": {
+                            "type": "string",
+                            "enum": [
+                                "C_SUITE",
+                                "VP",
+                                "DIRECTOR",
+                                "MANAGER",
+                                "IC",
+                            ],
+                        },
+                        "reports_to": {"type": ["string", "null"]},
+                    },
+                    "required": ["role", "level"],
+                },
+            },
+            "tasks": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "additionalProperties": False,
+                    "properties": {
+                        "title": {"type": "string"},
+                        "description": {"type": "string"},
+                        "assignee": {"type": "string"},
+                        "depends_on": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "default": [],
+                        },
+                        "dod": {"type": "string"},
+                    },
+                    "required": ["title", "assignee"],
+                },
+            },
+            "budget_policy": {
+                "type": "string",
+                "enum": ["CONSERVATIVE", "BALANCED", "AGGRESSIVE"],
+            },
+            "forecast_cost_usd": {"type": "number"},
+            "okrs": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "additionalProperties": False,
+                    "properties": {
+                        "owner_role": {"type": "string"},
+                        "objective": {"type": "string"},
+                        "key_results": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "metric": {"type": "string"},
+                                    "target": {"type": ["number", "integer"]},
+                                },
+                                "required": ["metric", "target"],
+                                "additionalProperties": False,
+                            },
+                            "default": [],
+                        },
+                        "kpis": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "metric": {"type": "string"},
+                                    "target": {"type": ["number", "integer"]},
+                                },
+                                "required": ["metric", "target"],
+                                "additionalProperties": False,
+                            },
+                            "default": [],
+                        },
+                    },
+                    "required": ["owner_role", "objective"],
+                },
+            },
+        },
+        "required": ["agents", "tasks", "budget_policy"],
+    },
+}
+
+# Stable prompt prefix: the planning instructions plus the serialized response
+# schema, concatenated into one long system message. Keeping all invariant
+# tokens at the front lets OpenAI's automatic prompt caching discount the
+# prefix across calls; the per-call PRD/budget rides in a short user message.
+_SYSTEM_MSG = (
+    "You are an expert organizational designer for an AI agent orchestrator. "
+    "Propose a lean, effective team and task plan strictly as JSON. "
+    "Be mindful of budget and scope. "
+    "Design an Organizational Agent Graph (OAG) for the PRD and budget given "
+    "in the user message. Return ONLY JSON matching this schema.\n"
+    "Schema: " + (
+        orjson.dumps(_OAG_SCHEMA, option=orjson.OPT_SORT_KEYS).decode()
+        if orjson is not None
+        else json.dumps(_OAG_SCHEMA, sort_keys=True)
+    )
+)
+
+# Built once; chat.completions.create receives the same mapping every call
+# instead of a per-call literal.
+_RESPONSE_FORMAT = {"type": "json_schema", "json_schema": _OAG_SCHEMA}
+
+
+def _model() -> str:
+    # Read through the process-lifetime env cache; a module constant would
+    # freeze the value before embedders get a chance to set SEREN_MODEL.
+    return _env("SEREN_MODEL") or "gpt-4o-mini"
 
 
 class SerenPlanner:
@@ -53,8 +569,13 @@ class SerenPlanner:
     deterministic heuristics under mock or missing provider configuration.
     """
 
+    # Completed plans kept per planner, newest-last; identical (prd, budget,
+    # context) triples repeat routinely in tests and CLI retries.
+    _PLAN_LRU_MAX = 128
+
     def __init__(self, selector: Selector | None = None):
-        self.selector = selector or Selector()
+        self.selector = selector or _default_selector()
+        self._lru: OrderedDict[str, bytes] = OrderedDict()
 
     def plan(
         self,
@@ -63,8 +584,35 @@ class SerenPlanner:
         context: dict[str, Any] | None = None,
     ) -> OAG:
         context = context or {}
+        # The effective mode and model are part of the key: a process-shared
+        # planner serves per-request modes (chunk2-21), so a mock heuristic
+        # plan must never be replayed to a live caller or vice versa.
+        key = hashlib.blake2b(
+            json.dumps(
+                {"p": prd, "b": budget_usd, "c": context, "mode": _mode(), "model": _model()},
+                sort_keys=True,
+                default=str,
+            ).encode()
+        ).hexdigest()
+        cached = self._lru.get(key)
+        if cached is not None:
+            self._lru.move_to_end(key)
+            # OAGs are mutated downstream (statuses, cost tracking), so a hit
+            # hands back a fresh deep copy of the cached plan.
+            return pickle.loads(cached)
+        oag = self._plan_uncached(prd, budget_usd)
+        self._lru[key] = pickle.dumps(oag)
+        if len(self._lru) > self._PLAN_LRU_MAX:
+            self._lru.popitem(last=False)
+        return oag
+
+    def _plan_uncached(self, prd: dict[str, Any], budget_usd: float) -> OAG:
         # Keep offline path for tests and CI
-        if os.getenv("PLUGAH_MODE") == "mock":
+        if _mode() == "mock":
+            return self._heuristic_plan(prd, budget_usd)
+        # Without a provider the OpenAI call can only fail; skip straight to
+        # the deterministic plan instead of building the request first.
+        if not self._provider_configured():
             return self._heuristic_plan(prd, budget_usd)
 
         # Use OpenAI API for planning; avoid heuristics when possible
@@ -75,6 +623,130 @@ class SerenPlanner:
             # This keeps the CLI functional even without keys, but is not the preferred path.
             return self._heuristic_plan(prd, budget_usd)
 
+    async def plan_async(
+        self,
+        prd: dict[str, Any],
+        budget_usd: float,
+        context: dict[str, Any] | None = None,
+    ) -> OAG:
+        """Async plan() with a bounded provider timeout.
+
+        Awaits the OpenAI call natively on the event loop and races it
+        against SEREN_PLAN_TIMEOUT (seconds, default 60) while the
+        deterministic fallback is precomputed concurrently, so a slow or
+        failing provider degrades to an instant heuristic plan instead of
+        hanging callers on provider tail latency.
+        """
+        context = context or {}
+        if _mode() == "mock" or not self._provider_configured():
+            return self._heuristic_plan(prd, budget_usd)
+
+        heur_task = asyncio.create_task(asyncio.to_thread(self._heuristic_plan, prd, budget_usd))
+        llm_task = asyncio.create_task(self._openai_plan_async(prd, budget_usd))
+        timeout = float(os.getenv("SEREN_PLAN_TIMEOUT", "60"))
+        done, _ = await asyncio.wait({llm_task}, timeout=timeout)
+        if llm_task in done and llm_task.exception() is None:
+            heur_task.cancel()
+            return llm_task.result()
+        llm_task.cancel()
+        return await heur_task
+
+    def plan_many(
+        self,
+        prds: list[dict[str, Any]],
+        budgets: list[float],
+        max_concurrency: int = 10,
+    ) -> list[OAG]:
+        """Plan several PRDs in one shot (sync wrapper for plan_many_async)."""
+        return asyncio.run(self.plan_many_async(prds, budgets, max_concurrency=max_concurrency))
+
+    async def plan_many_async(
+        self,
+        prds: list[dict[str, Any]],
+        budgets: list[float],
+        max_concurrency: int = 10,
+    ) -> list[OAG]:
+        """Plan a batch of PRDs instead of looping plan() serially.
+
+        Mock mode and missing-provider runs stay fully local. Otherwise,
+        SEREN_BATCH=1 routes the whole set through the OpenAI Batch API
+        (roughly half the token cost, but minutes-to-hours of latency);
+        the default path fans out async calls bounded by an
+        asyncio.Semaphore, with per-item heuristic fallback on failure.
+        """
+        if len(prds) != len(budgets):
+            raise ValueError("prds and budgets must have the same length")
+        if _mode() == "mock" or not self._provider_configured():
+            return [self._heuristic_plan(p, b) for p, b in zip(prds, budgets)]
+        if (os.getenv("SEREN_BATCH") or "").lower() in {"1", "true", "on"}:
+            return await asyncio.to_thread(self._batch_plan, prds, budgets)
+
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def _one(prd: dict[str, Any], budget: float) -> OAG:
+            async with sem:
+                try:
+                    return await self._openai_plan_async(prd, budget)
+                except Exception:
+                    return self._heuristic_plan(prd, budget)
+
+        return list(await asyncio.gather(*(_one(p, b) for p, b in zip(prds, budgets))))
+
+    def _batch_plan(self, prds: list[dict[str, Any]], budgets: list[float]) -> list[OAG]:
+        """Submit every plan request as one OpenAI Batch job and poll it.
+
+        Used by plan_many_async when SEREN_BATCH is set; any item missing
+        from the batch output falls back to the deterministic plan.
+        """
+        import io
+        import time
+
+        client = _get_client()
+        payload = "\n".join(
+            json.dumps(
+                {
+                    "custom_id": str(i),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": self._plan_request(prd, budget),
+                }
+            )
+            for i, (prd, budget) in enumerate(zip(prds, budgets))
+        ).encode()
+        batch_file = client.files.create(file=io.BytesIO(payload), purpose="batch")
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        poll = float(os.getenv("SEREN_BATCH_POLL", "10"))
+        while batch.status not in {"completed", "failed", "expired", "cancelled"}:
+            time.sleep(poll)
+            batch = client.batches.retrieve(batch.id)
+
+        designs: dict[int, dict[str, Any]] = {}
+        if batch.status == "completed" and batch.output_file_id:
+            for line in client.files.content(batch.output_file_id).text.splitlines():
+                if not line:
+                    continue
+                rec = json.loads(line)
+                choices = ((rec.get("response") or {}).get("body") or {}).get("choices") or []
+                if choices:
+                    content = choices[0].get("message", {}).get("content") or "{}"
+                    designs[int(rec["custom_id"])] = self._design_from_content(content)
+        return [
+            self._oag_from_design(prd, budget, designs[i])
+            if i in designs
+            else self._heuristic_plan(prd, budget)
+            for i, (prd, budget) in enumerate(zip(prds, budgets))
+        ]
+
+    @staticmethod
+    def _provider_configured() -> bool:
+        return OpenAI is not None and bool(
+            _env("OPENAI_API_KEY") or _env("SEREN_PROVIDER")
+        )
+
     # ----------------------------
     # OpenAI-backed orchestration
     # ----------------------------
@@ -82,172 +754,138 @@ class SerenPlanner:
         """Use OpenAI to propose an OAG, budget policy, cost, and OKRs in one pass."""
         if OpenAI is None:
             raise RuntimeError("openai package not installed. pip install openai >= 1.0.0")
-        client: Any = OpenAI()
+        key = _design_cache_key(prd, budget_usd, _model())
+        design = _design_cache_get(key)
+        if design is None and _template_cache_enabled():
+            design = _TEMPLATE_CACHE.get(self._template_sig(prd, budget_usd))
+        if design is None:
+            # Stream the completion and collect content deltas as they
+            # arrive: the response is consumed chunk-by-chunk off the socket
+            # rather than buffered into one full completion object first.
+            # The whole call (including stream consumption) sits inside the
+            # retry wrapper so a mid-stream drop retries too.
+            def _invoke() -> str:
+                stream = _get_client().chat.completions.create(
+                    **self._plan_request(prd, budget_usd), stream=True
+                )
+                parts: list[str] = []
+                for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        parts.append(chunk.choices[0].delta.content)
+                return "".join(parts) or "{}"
 
-        system = (
-            "You are an expert organizational designer for an AI agent orchestrator. "
-            "Propose a lean, effective team and task plan strictly as JSON. "
-            "Be mindful of budget and scope."
-        )
-        user = (
-            "Design an Organizational Agent Graph (OAG) for the following PRD and budget.\n"
-            "Return ONLY JSON matching the provided schema.\n\n"
-            f"PRD: {prd}\nBudget USD: {budget_usd}\n"
+            design = self._design_from_content(_with_retries(_invoke))
+            _design_cache_put(key, design)
+            if _template_cache_enabled():
+                _TEMPLATE_CACHE[self._template_sig(prd, budget_usd)] = design
+        return self._oag_from_design(prd, budget_usd, design)
+
+    async def _openai_plan_async(self, prd: dict[str, Any], budget_usd: float) -> OAG:
+        """Async twin of _openai_plan, awaited directly on the event loop.
+
+        Identical request and parsing; only the transport differs, so callers
+        already running under asyncio skip the worker-thread hop entirely.
+        """
+        if AsyncOpenAI is None:
+            raise RuntimeError("openai package not installed. pip install openai >= 1.0.0")
+        key = _design_cache_key(prd, budget_usd, _model())
+        design = _design_cache_get(key)
+        if design is None and _template_cache_enabled():
+            design = _TEMPLATE_CACHE.get(self._template_sig(prd, budget_usd))
+        if design is None:
+            async def _invoke() -> str:
+                stream = await _get_async_client().chat.completions.create(
+                    **self._plan_request(prd, budget_usd), stream=True
+                )
+                parts: list[str] = []
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        parts.append(chunk.choices[0].delta.content)
+                return "".join(parts) or "{}"
+
+            design = self._design_from_content(await _with_retries_async(_invoke))
+            _design_cache_put(key, design)
+            if _template_cache_enabled():
+                _TEMPLATE_CACHE[self._template_sig(prd, budget_usd)] = design
+        return self._oag_from_design(prd, budget_usd, design)
+
+    def _template_sig(self, prd: dict[str, Any], budget_usd: float) -> tuple:
+        """Coarse shape signature used by the opt-in template cache."""
+        objectives = prd.get("objectives", []) or []
+        return (
+            str(prd.get("domain", "general")),
+            self._estimate_scope_size(objectives),
+            round(math.log2(max(1.0, budget_usd))),
+            len(objectives),
         )
 
-        # Response schema captures decisions to avoid local heuristics
-        schema = {
-            "name": "oag_design",
-            "schema": {
-                "type": "object",
-                "additionalProperties": False,
-                "properties": {
-                    "agents": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "additionalProperties": False,
-                            "properties": {
-                                "role": {"type": "string"},
-                                "level": {
-                                    "type": "string",
-                                    "enum": [
-                                        "C_SUITE",
-                                        "VP",
-                                        "DIRECTOR",
-                                        "MANAGER",
-                                        "IC",
-                                    ],
-                                },
-                                "reports_to": {"type": ["string", "null"]},
-                            },
-                            "required": ["role", "level"],
-                        },
-                    },
-                    "tasks": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "additionalProperties": False,
-                            "properties": {
-                                "title": {"type": "string"},
-                                "description": {"type": "string"},
-                                "assignee": {"type": "string"},
-                                "depends_on": {
-                                    "type": "array",
-                                    "items": {"type": "string"},
-                                    "default": [],
-                                },
-                                "dod": {"type": "string"},
-                            },
-                            "required": ["title", "assignee"],
-                        },
-                    },
-                    "budget_policy": {
-                        "type": "string",
-                        "enum": ["CONSERVATIVE", "BALANCED", "AGGRESSIVE"],
-                    },
-                    "forecast_cost_usd": {"type": "number"},
-                    "okrs": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "additionalProperties": False,
-                            "properties": {
-                                "owner_role": {"type": "string"},
-                                "objective": {"type": "string"},
-                                "key_results": {
-                                    "type": "array",
-                                    "items": {
-                                        "type": "object",
-                                        "properties": {
-                                            "metric": {"type": "string"},
-                                            "target": {"type": ["number", "integer"]},
-                                        },
-                                        "required": ["metric", "target"],
-                                        "additionalProperties": False,
-                                    },
-                                    "default": [],
-                                },
-                                "kpis": {
-                                    "type": "array",
-                                    "items": {
-                                        "type": "object",
-                                        "properties": {
-                                            "metric": {"type": "string"},
-                                            "target": {"type": ["number", "integer"]},
-                                        },
-                                        "required": ["metric", "target"],
-                                        "additionalProperties": False,
-                                    },
-                                    "default": [],
-                                },
-                            },
-                            "required": ["owner_role", "objective"],
-                        },
-                    },
-                },
-                "required": ["agents", "tasks", "budget_policy"],
-            },
-        }
+    def _plan_request(self, prd: dict[str, Any], budget_usd: float) -> dict[str, Any]:
+        """Build the chat.completions.create kwargs shared by both transports.
 
-        completion = client.chat.completions.create(
-            model=os.getenv("SEREN_MODEL", "gpt-4o-mini"),
-            response_format={
-                "type": "json_schema",
-                "json_schema": schema,
-            },
-            messages=[
-                {"role": "system", "content": system},
-                {"role": "user", "content": user},
+        Every invariant token (instructions plus serialized schema) lives in
+        the module-level _SYSTEM_MSG prefix so provider-side prompt caching
+        can discount it; only the short user message varies per call.
+        """
+        return {
+            "model": _model(),
+            "response_format": _RESPONSE_FORMAT,
+            "messages": [
+                {"role": "system", "content": _SYSTEM_MSG},
+                {
+                    "role": "user",
+                    "content": f"PRD: {json.dumps(prd, default=str)}\nBudget USD: {budget_usd}",
+                },
             ],
-            temperature=0.2,
-        )
-        content = completion.choices[0].message.content or "{}"
+            "temperature": 0.2,
+        }
 
-        import json
+    def _design_from_content(self, content: str) -> dict[str, Any]:
         try:
-            design = json.loads(content)
+            return _json_loads(content)
         except Exception as e:  # pragma: no cover
             # Last-resort parse (should not happen with JSON schema)
             parsed = self._parse_design_output(content)
             if not parsed:
                 raise e
-            design = parsed
-
-        return self._oag_from_design(prd, budget_usd, design)
+            return parsed
 
     def _parse_design_output(self, text: str) -> dict[str, Any] | None:
-        import json
-        import re
         if not text:
             return None
         # Try strict JSON parse first
         try:
-            return json.loads(text)
+            return _json_loads(text)
         except Exception:
             pass
-        # Extract JSON block heuristically
-        m = re.search(r"\{[\s\S]*\}$", text.strip())
-        if not m:
-            return None
-        try:
-            return json.loads(m.group(0))
-        except Exception:
-            return None
+        # The common failure shape is one JSON object wrapped in prose or
+        # code fences; slicing from the first "{" to the last "}" recovers it
+        # with a single parse before falling back to the full scan.
+        start = text.find("{")
+        end = text.rfind("}")
+        if start != -1 and end > start:
+            try:
+                obj = _json_loads(text[start:end + 1])
+                if isinstance(obj, dict):
+                    return obj
+            except Exception:
+                pass
+        # Scan for the first decodable JSON object. raw_decode is O(n) and
+        # avoids the old greedy-regex extraction, which could backtrack badly
+        # on long malformed model output.
+        idx = start
+        while idx != -1:
+            try:
+                obj, _ = _JSON_DECODER.raw_decode(text, idx)
+            except ValueError:
+                idx = text.find("{", idx + 1)
+                continue
+            if isinstance(obj, dict):
+                return obj
+            idx = text.find("{", idx + 1)
+        return None
 
     def _role_to_level(self, role: str) -> RoleLevel:
-        # Fallback only; primary path expects level from OpenAI output
-        r = role.lower()
-        if any(k in r for k in ["ceo", "cto", "cfo", "chief"]):
-            return RoleLevel.C_SUITE
-        if r.startswith("vp"):
-            return RoleLevel.VP
-        if "director" in r:
-            return RoleLevel.DIRECTOR
-        if "manager" in r:
-            return RoleLevel.MANAGER
-        return RoleLevel.IC
+        return _role_to_level(role)
 
     def _oag_from_design(self, prd: dict[str, Any], budget_usd: float, design: dict[str, Any]) -> OAG:
         project_id = str(uuid.uuid4())
@@ -273,57 +911,84 @@ class SerenPlanner:
         # Build agents with ids and record by role
         role_to_id: dict[str, str] = {}
         agents = design.get("agents", []) or []
-        for a in agents:
+        agent_ids = _mint_ids(len(agents))
+        new_agents: list[AgentSpec] = []
+        for i, a in enumerate(agents):
             role = str(a.get("role", "IC")).strip()
             level_name = str(a.get("level", "")).upper()
             try:
                 level = RoleLevel[level_name]
             except Exception:
                 level = self._role_to_level(role)
-            agent = AgentSpec(id=str(uuid.uuid4()), role=role, level=level)
-            oag.add_node(agent)
+            agent = AgentSpec(id=agent_ids[i], role=role, level=level)
+            new_agents.append(agent)
             role_to_id[role] = agent.id
+        _add_nodes(oag, new_agents)
 
-        # Wire reporting edges
+        # Wire reporting edges: collect the endpoints first so the edge ids
+        # can be minted and the edges inserted in one batch.
+        report_pairs: list[tuple[str, str]] = []
         for a in agents:
             role = str(a.get("role", "")).strip()
             mgr = a.get("reports_to")
             if mgr and role in role_to_id and mgr in role_to_id:
-                oag.add_edge(Edge(id=str(uuid.uuid4()), from_id=role_to_id[mgr], to_id=role_to_id[role]))
+                report_pairs.append((role_to_id[mgr], role_to_id[role]))
+        _add_edges(oag, [
+            Edge(id=eid, from_id=from_id, to_id=to_id)
+            for eid, (from_id, to_id) in zip(_mint_ids(len(report_pairs)), report_pairs)
+        ])
 
-        # Build tasks
+        # Build tasks, indexing task ids by the design's titles as we go so
+        # depends_on entries (which reference titles) resolve correctly.
         tasks = []
-        for t in design.get("tasks", []) or []:
+        title_to_id: dict[str, str] = {}
+        pending_deps: list[tuple[str, list]] = []
+        default_agent_id = next(iter(role_to_id.values()), None)
+        raw_tasks = design.get("tasks", []) or []
+        # Two ids per task: one for the TaskSpec, one spare for the orphan
+        # agent_id fallback when the design named no resolvable assignee.
+        task_ids = _mint_ids(2 * len(raw_tasks))
+        for i, t in enumerate(raw_tasks):
+            # Bind the repeated fields once per task; this loop is the hot
+            # path when parsing large designs.
+            title = t.get("title", "")
+            desc = t.get("description")
+            dod = t.get("dod")
             assignee_role = str(t.get("assignee", "")).strip()
-            agent_id = role_to_id.get(assignee_role)
-            if not agent_id and role_to_id:
-                agent_id = next(iter(role_to_id.values()))
+            agent_id = role_to_id.get(assignee_role) or default_agent_id
             contract = Contract(
-                inputs=[ContractIO(name="spec", dtype="text", description=t.get("title", ""))],
-                outputs=[ContractIO(name="deliverable", dtype="text", description=t.get("dod", "deliverable"))],
-                definition_of_done=t.get("dod", "Meets acceptance criteria"),
+                inputs=[ContractIO(name="spec", dtype="text", description=title)],
+                outputs=[ContractIO(name="deliverable", dtype="text", description=dod or "deliverable")],
+                definition_of_done=dod or "Meets acceptance criteria",
             )
             task = TaskSpec(
-                id=str(uuid.uuid4()),
-                description=t.get("description", t.get("title", "Task")),
-                agent_id=agent_id or str(uuid.uuid4()),
+                id=task_ids[2 * i],
+                description=desc or title or "Task",
+                agent_id=agent_id or task_ids[2 * i + 1],
                 contract=contract,
-                expected_output=t.get("dod", "deliverable"),
+                expected_output=dod or "deliverable",
                 status=TaskStatus.PLANNED,
                 cost=CostTrack(est_cost_usd=0.0),
             )
-            oag.add_node(task)
             tasks.append(task)
-
-        # Task dependencies
-        title_to_id = {t.description: t.id for t in tasks}
-        for t in design.get("tasks", []) or []:
+            title_to_id[str(title or desc or "")] = task.id
             depends = t.get("depends_on", []) or []
-            to_id = title_to_id.get(t.get("description", t.get("title", "")))
-            for d in depends:
-                from_id = title_to_id.get(d)
-                if from_id and to_id:
-                    oag.add_edge(Edge(id=str(uuid.uuid4()), from_id=from_id, to_id=to_id))
+            if depends:
+                pending_deps.append((task.id, depends))
+        _add_nodes(oag, tasks)
+
+        # Task dependencies: collected during the build loop above, resolved
+        # here so forward references to later titles still work.
+        dep_pairs = [
+            (from_id, to_id)
+            for to_id, depends in pending_deps
+            for d in depends
+            if (from_id := title_to_id.get(d))
+        ]
+        _add_edges(oag, [
+            Edge(id=eid, from_id=from_id, to_id=to_id)
+            for eid, (from_id, to_id) in zip(_mint_ids(len(dep_pairs)), dep_pairs)
+        ])
 
         # Attach OKRs/KPIs from model output if present; otherwise fall back
         self._attach_okrs_kpis_from_design(oag, design)
@@ -331,35 +996,43 @@ class SerenPlanner:
 
     def _attach_okrs_kpis_from_design(self, oag: OAG, design: dict[str, Any]) -> None:
         okrs = design.get("okrs") or []
-        role_to_id = {a.role: a.id for a in oag.get_agents().values()}
+        # One get_agents() call for the whole attachment; the old code paid
+        # it per OKR and per KPI.
+        agents = oag.get_agents()
+        role_to_id = {a.role: a.id for a in agents.values()}
         for entry in okrs:
             owner_role = str(entry.get("owner_role", "")).strip()
             owner_id = role_to_id.get(owner_role)
             if not owner_id:
                 continue
+            owner = agents[owner_id]
+            raw_krs = entry.get("key_results", []) or []
+            raw_kpis = entry.get("kpis", []) or []
+            # One batch per entry: objective id + one id per KR and KPI.
+            ids = _mint_ids(1 + len(raw_krs) + len(raw_kpis))
             obj = Objective(
-                id=str(uuid.uuid4()),
+                id=ids[0],
                 title=str(entry.get("objective", "Deliver outcomes")),
                 description=str(entry.get("objective", "Deliver outcomes")),
                 owner_agent_id=owner_id,
             )
             krs: list[KeyResult] = []
-            for kr in entry.get("key_results", []) or []:
+            for i, kr in enumerate(raw_krs, start=1):
                 krs.append(
                     KeyResult(
-                        id=str(uuid.uuid4()),
+                        id=ids[i],
                         objective_id=obj.id,
                         metric=str(kr.get("metric", "metric")),
                         target=float(kr.get("target", 1)),
                         current=0,
                     )
                 )
-            oag.get_agents()[owner_id].okrs.append(OKR(objective=obj, key_results=krs))
+            owner.okrs.append(OKR(objective=obj, key_results=krs))
             # KPIs
-            for kpi in entry.get("kpis", []) or []:
-                oag.get_agents()[owner_id].kpis.append(
+            for i, kpi in enumerate(raw_kpis, start=1 + len(raw_krs)):
+                owner.kpis.append(
                     KPI(
-                        id=str(uuid.uuid4()),
+                        id=ids[i],
                         metric=str(kpi.get("metric", "metric")),
                         target=float(kpi.get("target", 1)),
                         current=0,
@@ -404,10 +1077,14 @@ class SerenPlanner:
         ics = self._create_ics(oag, title, domain, managers, staffing.get("ics", 3))
 
         # Tasks from objectives
-        tasks = self._create_tasks(oag, objectives, success_criteria, ics)
+        tasks, owned = self._create_tasks(oag, objectives, success_criteria, ics)
         self._create_task_dependencies(oag, tasks)
+        self._attach_okrs_kpis(oag, owned)
 
-        oag.budget.forecast_cost_usd = self._forecast_cost(oag)
+        # Forecast from counts we already have (3 board-room agents plus the
+        # staffed levels) instead of re-scanning the node dict.
+        agent_count = 3 + len(vps) + len(directors) + len(managers) + len(ics)
+        oag.budget.forecast_cost_usd = round(agent_count * 10.0, 2)
         return oag
 
     # ---- Heuristic helpers (adapted from stock planner patterns) ----
@@ -425,53 +1102,32 @@ class SerenPlanner:
         return "small" if n <= 2 else "medium" if n <= 5 else "large"
 
     def _create_board_room(self, oag: OAG, title: str, domain: str) -> None:
-        ceo = AgentSpec(id=str(uuid.uuid4()), role="CEO", level=RoleLevel.C_SUITE)
-        cto = AgentSpec(id=str(uuid.uuid4()), role="CTO", level=RoleLevel.C_SUITE, manager_id=ceo.id)
-        cfo = AgentSpec(id=str(uuid.uuid4()), role="CFO", level=RoleLevel.C_SUITE, manager_id=ceo.id)
-        oag.add_node(ceo)
-        oag.add_node(cto)
-        oag.add_node(cfo)
-        oag.add_edge(Edge(id=str(uuid.uuid4()), from_id=ceo.id, to_id=cto.id))
-        oag.add_edge(Edge(id=str(uuid.uuid4()), from_id=ceo.id, to_id=cfo.id))
+        ids = _mint_ids(5)
+        ceo = _construct(AgentSpec, id=ids[0], role="CEO", level=RoleLevel.C_SUITE)
+        cto = _construct(AgentSpec, id=ids[1], role="CTO", level=RoleLevel.C_SUITE, manager_id=ceo.id)
+        cfo = _construct(AgentSpec, id=ids[2], role="CFO", level=RoleLevel.C_SUITE, manager_id=ceo.id)
+        _add_nodes(oag, [ceo, cto, cfo])
+        _add_edges(oag, [
+            _construct(Edge, id=ids[3], from_id=ceo.id, to_id=cto.id),
+            _construct(Edge, id=ids[4], from_id=ceo.id, to_id=cfo.id),
+        ])
 
     def _create_vps(self, oag: OAG, title: str, domain: str, count: int) -> list[AgentSpec]:
         roles = ["VP Engineering", "VP Product", "VP Marketing"]
-        vps: list[AgentSpec] = []
-        for i in range(min(count, len(roles))):
-            spec = AgentSpec(id=str(uuid.uuid4()), role=roles[i], level=RoleLevel.VP)
-            oag.add_node(spec)
-            vps.append(spec)
+        n = min(count, len(roles))
+        ids = _mint_ids(n)
+        vps = [_construct(AgentSpec, id=ids[i], role=roles[i], level=RoleLevel.VP) for i in range(n)]
+        _add_nodes(oag, vps)
         return vps
 
     def _create_directors(self, oag: OAG, title: str, domain: str, vps: list[AgentSpec], count: int) -> list[AgentSpec]:
-        directors: list[AgentSpec] = []
-        for i in range(count):
-            spec = AgentSpec(id=str(uuid.uuid4()), role=f"Director {i+1}", level=RoleLevel.DIRECTOR, manager_id=(vps[0].id if vps else None))
-            oag.add_node(spec)
-            if vps:
-                oag.add_edge(Edge(id=str(uuid.uuid4()), from_id=vps[i % len(vps)].id, to_id=spec.id))
-            directors.append(spec)
-        return directors
+        return _stage_level(oag, _role_names("director", count), RoleLevel.DIRECTOR, vps)
 
     def _create_managers(self, oag: OAG, title: str, domain: str, directors: list[AgentSpec], count: int) -> list[AgentSpec]:
-        managers: list[AgentSpec] = []
-        for i in range(count):
-            spec = AgentSpec(id=str(uuid.uuid4()), role=f"Engineering Manager {i+1}", level=RoleLevel.MANAGER, manager_id=(directors[0].id if directors else None))
-            oag.add_node(spec)
-            if directors:
-                oag.add_edge(Edge(id=str(uuid.uuid4()), from_id=directors[i % len(directors)].id, to_id=spec.id))
-            managers.append(spec)
-        return managers
+        return _stage_level(oag, _role_names("manager", count), RoleLevel.MANAGER, directors)
 
     def _create_ics(self, oag: OAG, title: str, domain: str, managers: list[AgentSpec], count: int) -> list[AgentSpec]:
-        ics: list[AgentSpec] = []
-        for i in range(count):
-            spec = AgentSpec(id=str(uuid.uuid4()), role=f"IC {i+1}", level=RoleLevel.IC, manager_id=(managers[0].id if managers else None))
-            oag.add_node(spec)
-            if managers:
-                oag.add_edge(Edge(id=str(uuid.uuid4()), from_id=managers[i % len(managers)].id, to_id=spec.id))
-            ics.append(spec)
-        return ics
+        return _stage_level(oag, _role_names("ic", count), RoleLevel.IC, managers)
 
     def _create_tasks(
         self,
@@ -479,33 +1135,85 @@ class SerenPlanner:
         objectives: list[dict],
         success: list[str],
         assignees: list[AgentSpec],
-    ) -> list[TaskSpec]:
+    ) -> tuple[list[TaskSpec], dict[str, list[TaskSpec]]]:
+        """Create tasks and return them plus an agent_id -> tasks index.
+
+        The ownership index is a byproduct of the assignment we already do
+        here, so downstream consumers (OKR/KPI attachment) get it for free
+        instead of rebuilding it from the task list.
+        """
         tasks: list[TaskSpec] = []
+        owned: dict[str, list[TaskSpec]] = defaultdict(list)
         if not objectives:
             objectives = [{"title": "Deliver MVP", "description": "Ship core features"}]
+        ids = _mint_ids(len(objectives))
         for i, obj in enumerate(objectives, start=1):
             agent_id = assignees[i % len(assignees)].id if assignees else (oag.get_agents() or {"ceo": AgentSpec(id="ceo", role="CEO", level=RoleLevel.C_SUITE)}).popitem()[1].id
-            contract = Contract(
-                inputs=[ContractIO(name="spec", dtype="text", description=obj.get("title", ""))],
-                outputs=[ContractIO(name="deliverable", dtype="text", description="Resulting artifact")],
+            contract = _construct(
+                Contract,
+                inputs=[_construct(ContractIO, name="spec", dtype="text", description=obj.get("title", ""))],
+                outputs=[_construct(ContractIO, name="deliverable", dtype="text", description="Resulting artifact")],
                 definition_of_done="Meets acceptance criteria",
             )
-            t = TaskSpec(
-                id=str(uuid.uuid4()),
+            t = _construct(
+                TaskSpec,
+                id=ids[i - 1],
                 description=obj.get("description", obj.get("title", f"Objective {i}")),
                 agent_id=agent_id,
                 contract=contract,
                 expected_output="deliverable",
                 status=TaskStatus.PLANNED,
-                cost=CostTrack(est_cost_usd=0.0),
+                cost=_construct(CostTrack, est_cost_usd=0.0),
             )
-            oag.add_node(t)
             tasks.append(t)
-        return tasks
+            owned[agent_id].append(t)
+        _add_nodes(oag, tasks)
+        return tasks, owned
 
     def _create_task_dependencies(self, oag: OAG, tasks: list[TaskSpec]) -> None:
-        for i in range(1, len(tasks)):
-            oag.add_edge(Edge(id=str(uuid.uuid4()), from_id=tasks[i-1].id, to_id=tasks[i].id))
+        if len(tasks) < 2:
+            return
+        _add_edges(oag, [
+            _construct(Edge, id=nid, from_id=a.id, to_id=b.id)
+            for nid, (a, b) in zip(_mint_ids(len(tasks) - 1), pairwise(tasks))
+        ])
+
+    def _attach_okrs_kpis(self, oag: OAG, owned: dict[str, list[TaskSpec]]) -> None:
+        """Attach a default OKR and KPI to each agent that owns tasks.
+
+        Mirrors the design-path attachment for the mock path. Consumes the
+        agent_id -> tasks index produced by _create_tasks, so no re-scan of
+        the task list is needed here.
+        """
+        owners = [a for a in oag.get_agents().values() if owned.get(a.id)]
+        # Each owner needs an objective/key-result/KPI id; mint the whole
+        # batch in one urandom read.
+        ids = _mint_ids(3 * len(owners))
+        for i, agent in enumerate(owners):
+            agent_tasks = owned[agent.id]
+            obj_id, kr_id, kpi_id = ids[3 * i:3 * i + 3]
+            obj = Objective(
+                id=obj_id,
+                title=f"Deliver assigned work for {agent.role}",
+                description="Complete assigned tasks within budget",
+                owner_agent_id=agent.id,
+            )
+            kr = KeyResult(
+                id=kr_id,
+                objective_id=obj.id,
+                metric="tasks_completed",
+                target=float(len(agent_tasks)),
+                current=0,
+            )
+            agent.okrs.append(OKR(objective=obj, key_results=[kr]))
+            agent.kpis.append(
+                KPI(
+                    id=kpi_id,
+                    metric="on_budget",
+                    target=1,
+                    current=0,
+                )
+            )
 
     def _forecast_cost(self, oag: OAG) -> float:
         # Heuristic forecast used only in mock path
@@ -513,17 +1221,22 @@ class SerenPlanner:
         return round(num_agents * 10.0, 2)
 
 
+# plugah.boardroom module, cached after the first successful install so
+# repeated calls skip the import machinery.
+_boardroom_mod = None
+
 def install_seren_planner() -> type[SerenPlanner]:
-    """Install SerenPlanner into plugah.boardroom so BoardRoom uses it."""
-    import os
+    """Install SerenPlanner into plugah.boardroom so BoardRoom uses it.
+
+    Idempotent: re-invocations (e.g. from every _br() call in app.core) are a
+    no-op once the planner is in place or when it was swapped back elsewhere.
+    """
+    global _boardroom_mod
     if os.getenv("SEREN_PLANNER", "on").lower() in {"0", "false", "off"}:
         return SerenPlanner
-    import plugah.boardroom as br
-    br.Planner = SerenPlanner  # type: ignore[assignment]
+    if _boardroom_mod is None:
+        import plugah.boardroom as br
+        _boardroom_mod = br
+    if _boardroom_mod.__dict__.get("Planner") is not SerenPlanner:
+        _boardroom_mod.Planner = SerenPlanner  # type: ignore[assignment]
     return SerenPlanner
-
-# Make Seren the default planner on import (can be disabled via SEREN_PLANNER=off)
-try:
-    install_seren_planner()
-except Exception:
-    pass
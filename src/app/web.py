@@ -1,7 +1,7 @@
 from fastapi import FastAPI
 from pydantic import BaseModel
 import os
-from .core import run_discovery, build_prd, plan_oag, execute_plan
+from .core import run_discovery, build_prd, plan_oag, execute_plan, flush_writes
 
 app = FastAPI(title="Plugah Orchestrator API", version="0.1.0")
 
@@ -22,17 +22,26 @@ class PlanReq(BaseModel):
 
 @app.post("/orchestrate")
 async def orchestrate(req: OrchestrateReq):
-    if req.mock:
-        os.environ["PLUGAH_MODE"] = "mock"
-    questions = await run_discovery(req.problem, req.budget, model_hint=req.model_hint, policy=req.policy)
+    # Mode is threaded through per request — "live" explicitly, so the
+    # request-scoped ContextVar always decides and a concurrent mock request
+    # cannot leak into this one.
+    mode = "mock" if req.mock else "live"
+    questions = await run_discovery(
+        req.problem, req.budget, model_hint=req.model_hint, policy=req.policy, mode=mode
+    )
+    # The stage functions enqueue their JSON writes; settle them before
+    # returning so a failed write surfaces here instead of being dropped.
+    await flush_writes()
     return {"questions": questions}
 
 @app.post("/plan")
 async def plan(req: PlanReq):
-    if req.mock:
-        os.environ["PLUGAH_MODE"] = "mock"
-    prd = await build_prd(req.answers, req.problem, req.budget, model_hint=req.model_hint, policy=req.policy)
-    oag = await plan_oag(prd, req.budget, model_hint=req.model_hint, policy=req.policy)
+    mode = "mock" if req.mock else "live"
+    prd = await build_prd(
+        req.answers, req.problem, req.budget, model_hint=req.model_hint, policy=req.policy, mode=mode
+    )
+    oag = await plan_oag(prd, req.budget, model_hint=req.model_hint, policy=req.policy, mode=mode)
+    await flush_writes()
     return {"prd": prd, "oag": oag}
 
 @app.post("/execute")
@@ -42,4 +51,34 @@ async def execute():
 
 def serve():
     import uvicorn
-    uvicorn.run("app.web:app", host="127.0.0.1", port=8000, reload=True)
+
+    # uvloop + httptools roughly double raw request throughput over
+    # asyncio + h11; both ride the optional 'perf' extra, so fall back to
+    # uvicorn's auto-detection when they are absent.
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "auto"
+    try:
+        import httptools  # noqa: F401
+        http = "httptools"
+    except ImportError:
+        http = "auto"
+    # Autoreload is dev-only now (SEREN_WEB_RELOAD=1) since it is
+    # incompatible with multi-worker serving.
+    reload = bool(os.getenv("SEREN_WEB_RELOAD"))
+    # One worker by default: the stage flow is stateful (app.core keeps a
+    # single BoardRoom per process), so /orchestrate, /plan, and /execute
+    # must land on the same process. Multi-worker serving is strictly
+    # opt-in via SEREN_WEB_WORKERS for deployments with sticky routing.
+    workers = 1 if reload else int(os.getenv("SEREN_WEB_WORKERS", "1"))
+    uvicorn.run(
+        "app.web:app",
+        host=os.getenv("SEREN_WEB_HOST", "127.0.0.1"),
+        port=int(os.getenv("SEREN_WEB_PORT", "8000")),
+        loop=loop,
+        http=http,
+        workers=workers,
+        reload=reload,
+    )
@@ -3,16 +3,17 @@ plugah_seren: Drop-in Seren planner for Plugah
 
 Usage (in any Plugah-based app):
 
-    import plugah_seren  # auto-installs Seren planner
+    import plugah_seren
+    plugah_seren.enable()   # install Seren planner
     from plugah.boardroom import BoardRoom
     # BoardRoom().plan_organization(...) now uses SerenPlanner
 
-To control installation explicitly:
-
-    import plugah_seren
-    plugah_seren.enable()   # install Seren planner
     plugah_seren.disable()  # restore stock planner
 
+Importing this package has no side effects; plugah and the planner are only
+imported when enable() (or an attribute like SerenPlanner) is first used, so
+type-only consumers never pay the plugah.boardroom import.
+
 This package wraps Seren’s planner from `app.seren_planner` and replaces
 `plugah.boardroom.Planner` at runtime so consumers of Plugah need no code
 changes. In mock/offline mode (PLUGAH_MODE=mock), Seren emits a deterministic
@@ -55,13 +56,12 @@ def disable():
     _state.installed = False
 
 
-# Auto-install on import unless explicitly disabled via env
-def _auto():
-    import os
-    if os.getenv("SEREN_PLANNER", "on").lower() in {"0", "false", "off"}:
-        return
-    enable()
-
+def __getattr__(name: str):
+    # PEP 562: expose the planner class lazily so importing this package
+    # never drags in app.seren_planner (and with it plugah/openai).
+    if name == "SerenPlanner":
+        from app.seren_planner import SerenPlanner  # type: ignore
 
-_auto()
+        return SerenPlanner
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
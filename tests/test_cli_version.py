@@ -0,0 +1,15 @@
+from typer.testing import CliRunner
+
+from app.__main__ import _version
+from app.cli import app
+
+
+def test_version_flag():
+    result = CliRunner().invoke(app, ["--version"])
+    assert result.exit_code == 0
+    assert result.output.strip() == _version()
+
+
+def test_version_is_nonempty_string():
+    v = _version()
+    assert isinstance(v, str) and v
@@ -0,0 +1,116 @@
+import pytest
+
+from app import seren_planner as sp
+from app.seren_planner import SerenPlanner
+
+
+@pytest.fixture()
+def planner(monkeypatch):
+    monkeypatch.setenv("PLUGAH_MODE", "mock")
+    sp._reset_env_cache()
+    return SerenPlanner()
+
+
+def _prd(title: str) -> dict:
+    return {
+        "title": title,
+        "domain": "general",
+        "objectives": [{"title": "Deliver MVP", "description": "Ship core features"}],
+        "success_criteria": ["It works"],
+    }
+
+
+def test_plan_many_preserves_length_and_order(planner):
+    prds = [_prd(f"Project {i}") for i in range(3)]
+    budgets = [10.0, 20.0, 30.0]
+
+    oags = planner.plan_many(prds, budgets)
+
+    assert len(oags) == 3
+    assert [o.meta.title for o in oags] == [p["title"] for p in prds]
+    assert [o.budget.caps.hard_cap_usd for o in oags] == budgets
+
+
+def test_plan_many_length_mismatch(planner):
+    with pytest.raises(ValueError):
+        planner.plan_many([_prd("A")], [10.0, 20.0])
+
+
+def test_plan_many_heuristic_fallback_without_provider(monkeypatch):
+    # Live mode but no provider configured: every item must fall back to the
+    # deterministic plan without touching the network.
+    monkeypatch.delenv("PLUGAH_MODE", raising=False)
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.delenv("SEREN_PROVIDER", raising=False)
+    sp._reset_env_cache()
+
+    oags = SerenPlanner().plan_many([_prd("Solo")], [15.0])
+
+    assert len(oags) == 1
+    assert oags[0].meta.title == "Solo"
+
+
+def test_should_retry_plain_exception():
+    assert not sp._should_retry(RuntimeError("boom"))
+
+
+def test_should_retry_openai_errors():
+    openai = pytest.importorskip("openai")
+    httpx = pytest.importorskip("httpx")
+
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+
+    def status_error(code: int):
+        return openai.APIStatusError(
+            "err", response=httpx.Response(code, request=request), body=None
+        )
+
+    assert sp._should_retry(openai.APIConnectionError(request=request))
+    assert sp._should_retry(
+        openai.RateLimitError("429", response=httpx.Response(429, request=request), body=None)
+    )
+    assert sp._should_retry(status_error(500))
+    # 4xx (auth, bad request) must fail fast to the heuristic fallback.
+    assert not sp._should_retry(status_error(401))
+
+
+def test_retries_clamped_to_one_attempt(monkeypatch):
+    monkeypatch.setenv("SEREN_RETRIES", "0")
+    sp._reset_env_cache()
+    try:
+        assert sp._with_retries(lambda: "ran") == "ran"
+    finally:
+        sp._reset_env_cache()
+
+
+def test_plan_lru_returns_deep_copy(planner):
+    prd = _prd("Cached")
+
+    first = planner.plan(prd, 10.0)
+    second = planner.plan(prd, 10.0)
+
+    assert second is not first
+    assert second.meta.project_id == first.meta.project_id
+
+    # Mutating a returned plan must not poison the cached copy.
+    second.budget.forecast_cost_usd = 999.0
+    third = planner.plan(prd, 10.0)
+    assert third.budget.forecast_cost_usd == first.budget.forecast_cost_usd
+
+
+def test_plan_lru_keyed_by_mode(monkeypatch, planner):
+    # Without a provider the live entry also resolves heuristically/offline,
+    # but it must occupy its own LRU slot rather than replay the mock plan.
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.delenv("SEREN_PROVIDER", raising=False)
+    sp._reset_env_cache()
+    prd = _prd("Modal")
+
+    for mode in ("mock", "live"):
+        token = sp.PLUGAH_MODE_VAR.set(mode)
+        try:
+            planner.plan(prd, 10.0)
+        finally:
+            sp.PLUGAH_MODE_VAR.reset(token)
+
+    assert len(planner._lru) == 2
@@ -0,0 +1,43 @@
+import os
+
+from fastapi.testclient import TestClient
+
+from app.core import _mode_scope
+from app.seren_planner import PLUGAH_MODE_VAR
+from app.web import app
+
+
+def test_mode_scope_sets_and_restores(monkeypatch):
+    monkeypatch.delenv("PLUGAH_MODE", raising=False)
+
+    with _mode_scope("mock"):
+        assert PLUGAH_MODE_VAR.get() == "mock"
+        assert os.environ["PLUGAH_MODE"] == "mock"
+
+    assert PLUGAH_MODE_VAR.get() is None
+    assert "PLUGAH_MODE" not in os.environ
+
+
+def test_mode_scope_restores_previous_value(monkeypatch):
+    monkeypatch.setenv("PLUGAH_MODE", "live")
+
+    with _mode_scope("mock"):
+        assert os.environ["PLUGAH_MODE"] == "mock"
+
+    assert os.environ["PLUGAH_MODE"] == "live"
+
+
+def test_orchestrate_mock_does_not_leak_env(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("PLUGAH_MODE", raising=False)
+
+    client = TestClient(app)
+    resp = client.post(
+        "/orchestrate",
+        json={"problem": "Build a Slack summarizer bot", "budget": 10.0, "mock": True},
+    )
+
+    assert resp.status_code == 200
+    assert isinstance(resp.json().get("questions"), list)
+    # The request-scoped mode must not stick to the process.
+    assert "PLUGAH_MODE" not in os.environ